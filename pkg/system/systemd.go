@@ -21,6 +21,8 @@ const (
 	PropertiesChangedMethod = "org.freedesktop.DBus.Properties.PropertiesChanged"
 )
 
+var newlineRegexp = regexp.MustCompile(`\r?\n`)
+
 // DbusConn is a wrapper for the dbus.Conn external type
 type DbusConn interface {
 	Object(dest string, path dbus.ObjectPath) dbus.BusObject
@@ -474,8 +476,7 @@ func (sd *SystemdSupervisor) runUnit(ctx context.Context, config *ExecConfig, se
 		buffer := &bytes.Buffer{}
 		_, _ = buffer.ReadFrom(ptm)
 		output := buffer.String()
-		re := regexp.MustCompile(`\r?\n`)
-		return re.ReplaceAllString(output, " ")
+		return newlineRegexp.ReplaceAllString(output, " ")
 	}
 
 	props := config.ToDbus(ptsN, serviceType)